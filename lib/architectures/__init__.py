@@ -1,4 +1,4 @@
 from .approaches import DoubleModelApproach
-from .cnn import SimpleCNN
+from .cnn import SimpleCNN, quantize_for_inference
 
-__all__ = ["SimpleCNN", "DoubleModelApproach"]
+__all__ = ["SimpleCNN", "DoubleModelApproach", "quantize_for_inference"]
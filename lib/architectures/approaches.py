@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
 
 import torch
+from torch.ao.quantization import fuse_modules
 
 from .cnn import SimpleCNN
 
@@ -28,29 +30,110 @@ class DoubleModelApproach:
         self.threshold = threshold
         self.device = device
 
+        # Fold each Conv2d+ReLU pair into one module; a standalone ReLU costs
+        # a full read+write pass over the feature map.
+        fuse_modules(self.disease_detector.network, [["0", "1"], ["3", "4"]], inplace=True)
+        fuse_modules(self.symptom_identifier.network, [["0", "1"], ["3", "4"]], inplace=True)
+
+        aot_pair = (
+            self._load_or_export_aot(self.disease_detector, Path(disease_detection_state)),
+            self._load_or_export_aot(self.symptom_identifier, Path(symptom_identifier_state)),
+        )
+        if all(model is not None for model in aot_pair):
+            # AOTInductor artifacts are specialized for (N, 3, 32, 32) FP32
+            # input; the whole graph is one compiled call with no
+            # dynamic-shape guards and no warmup cost.
+            self.dtype = torch.float32
+            self.disease_detector, self.symptom_identifier = aot_pair
+        elif device.type == "cuda":
+            # Fixed input shape, so let cuDNN autotune its conv algorithms once.
+            torch.backends.cudnn.benchmark = True
+            # Halve bandwidth: weights are loaded in FP32 then cast.
+            self.dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            self.disease_detector.to(dtype=self.dtype)
+            self.symptom_identifier.to(dtype=self.dtype)
+            # reduce-overhead uses CUDA graphs to cut per-op launch latency,
+            # which dominates for CNNs this small.
+            self.disease_detector = torch.compile(
+                self.disease_detector, mode="reduce-overhead", fullgraph=True
+            )
+            self.symptom_identifier = torch.compile(
+                self.symptom_identifier, mode="reduce-overhead", fullgraph=True
+            )
+            self._warmup()
+        else:
+            self.dtype = torch.float32
+            # CPU path: trace to TorchScript and freeze for MKLDNN conv+relu
+            # fusion and constant-folded weights.
+            example = torch.zeros(1, 3, 32, 32, device=device)
+            self.disease_detector = torch.jit.optimize_for_inference(
+                torch.jit.trace(self.disease_detector, example)
+            )
+            self.symptom_identifier = torch.jit.optimize_for_inference(
+                torch.jit.trace(self.symptom_identifier, example)
+            )
+            # Extra passes trigger the JIT profiling/optimization step up front.
+            self._warmup()
+            self._warmup()
+
+    def _load_or_export_aot(self, model, state_path: Path):
+        """
+        Load the AOTInductor package cached next to ``state_path``, exporting
+        and caching one on the first run.
+
+        The package is specialized for ``(N, 3, 32, 32)`` input with a dynamic
+        batch dimension, so guard checks and per-op dispatch disappear, and —
+        unlike ``torch.compile`` — later process starts load the shared
+        library directly instead of recompiling.
+        """
+        from torch._inductor import aoti_compile_and_package, aoti_load_package
+
+        package_path = state_path.with_suffix(".pt2")
+        try:
+            if not package_path.is_file():
+                batch = torch.export.Dim("batch", min=1)
+                exported = torch.export.export(
+                    model,
+                    (torch.zeros(2, 3, 32, 32, device=self.device),),
+                    dynamic_shapes=({0: batch},),
+                )
+                aoti_compile_and_package(exported, package_path=os.fspath(package_path))
+            return aoti_load_package(os.fspath(package_path))
+        except Exception:
+            # Export coverage and the on-disk cache are both best effort; the
+            # compile/trace paths below remain the fallback.
+            return None
+
+    def _warmup(self) -> None:
+        """Run dummy forward passes so compilation cost is paid once in __init__."""
+        dummy = torch.zeros(1, 3, 32, 32, device=self.device, dtype=self.dtype)
+        with torch.inference_mode():
+            self.disease_detector(dummy)
+            self.symptom_identifier(dummy)
+
     def __call__(self, images):
-        preds = []
-
-        for img in images:
-            img = img.unsqueeze(0)  # Add batch dimension
-            disease_pred = self._detect_disease(img)
-            if disease_pred.item() == 1:
-                symptom_pred = self._identify_symptoms(img)
-                preds.append(symptom_pred.item())
-            else:
-                preds.append(12)  # No disease detected
-        return torch.tensor(preds)
+        images = list(images)
+        if not images:
+            # torch.stack rejects an empty list; keep the baseline behavior
+            # of returning an empty prediction tensor.
+            return torch.empty(0, dtype=torch.long)
+        images = torch.stack(images)
+        if self.device.type == "cuda" and not images.is_cuda:
+            # Pinned host memory lets the H2D copy run on the copy engine,
+            # overlapping with the previous batch's kernels.
+            images = images.pin_memory()
+        images = images.to(self.device, dtype=self.dtype, non_blocking=True)
+        is_unhealthy = self._detect_disease(images)
 
-    def _detect_disease(self, images):
-        images = images.to(self.device)
-        with torch.no_grad():
-            preds = self.disease_detector(images)
-            preds = (preds >= self.threshold).long()
+        preds = torch.full((images.shape[0],), 12, dtype=torch.long, device=self.device)
+        if is_unhealthy.any():
+            preds[is_unhealthy] = self._identify_symptoms(images[is_unhealthy])
         return preds.cpu()
 
+    def _detect_disease(self, images):
+        with torch.inference_mode():
+            return self.disease_detector(images).squeeze(1).float() >= self.threshold
+
     def _identify_symptoms(self, images):
-        images = images.to(self.device)
-        with torch.no_grad():
-            preds = self.symptom_identifier(images)
-            preds = preds.argmax(dim=1)
-        return preds.cpu()
+        with torch.inference_mode():
+            return self.symptom_identifier(images).argmax(dim=1)
@@ -1,3 +1,4 @@
+import torch
 import torch.nn as nn
 
 
@@ -19,3 +20,53 @@ class SimpleCNN(nn.Module):
 
     def forward(self, x):
         return self.network(x)
+
+
+def quantize_for_inference(
+    model: SimpleCNN,
+    calibration_loader,
+    backend: str = "fbgemm",
+    num_batches: int = 10,
+) -> nn.Module:
+    """
+    Apply post-training static INT8 quantization to a SimpleCNN for CPU inference.
+
+    Conv2d+ReLU pairs are fused, activations are calibrated on a few batches,
+    and the model is converted so convolutions and linears run as INT8 ops
+    (VNNI on recent x86), shrinking weights 4x.
+
+    Parameters
+    ----------
+    model : SimpleCNN
+        The model to quantize. Must already hold its trained weights.
+    calibration_loader : iterable
+        Yields ``(images, labels)`` batches used to calibrate activation
+        ranges, e.g. a ``DataLoader`` over one of the ``ImageDataset`` subclasses.
+    backend : str, optional
+        Quantized engine, ``"fbgemm"`` (x86, default) or ``"qnnpack"`` (ARM).
+    num_batches : int, optional
+        Number of calibration batches to run. Defaults to 10.
+
+    Returns
+    -------
+    nn.Module
+        The converted INT8 model, wrapped with quant/dequant stubs so it
+        accepts and returns float tensors like the original.
+    """
+    from torch.ao import quantization
+
+    model = model.cpu().eval()
+    quantization.fuse_modules(model.network, [["0", "1"], ["3", "4"]], inplace=True)
+
+    wrapper = quantization.QuantWrapper(model)
+    wrapper.qconfig = quantization.get_default_qconfig(backend)
+    torch.backends.quantized.engine = backend
+
+    prepared = quantization.prepare(wrapper)
+    with torch.inference_mode():
+        for batch_idx, (images, _) in enumerate(calibration_loader):
+            if batch_idx >= num_batches:
+                break
+            prepared(images)
+
+    return quantization.convert(prepared)
@@ -31,20 +31,43 @@ class Environments(Enum):
     LOGGING_LEVEL = os.getenv("LOGGING_LEVEL", "INFO")
 
 
+def _no_typecheck(func):
+    return func
+
+
+# Runtime type validation is useful while debugging but adds per-call overhead
+# in hot constructors (e.g. Dataset classes re-instantiated in every DataLoader
+# worker), so it is opt-in via the DEBUG_TYPES environment variable.
+if os.getenv("DEBUG_TYPES"):
+    from beartype import beartype as typecheck
+else:
+    typecheck = _no_typecheck
+
+
 logger.remove(0)
 logger.add(Directories.LOGS_DIR.value / "runtime.log", mode="w", level="DEBUG")
 
-# If tqdm is installed, configure loguru with tqdm.write
-# https://github.com/Delgan/loguru/issues/135
-try:
-    from tqdm import tqdm
+_console_write = None
+
+
+def _console_sink(message) -> None:
+    # If tqdm is installed, route console logs through tqdm.write
+    # (https://github.com/Delgan/loguru/issues/135). Resolved on the first
+    # emitted record so importing lib.config does not pay for the tqdm
+    # import graph.
+    global _console_write
+    if _console_write is None:
+        try:
+            from tqdm import tqdm
+
+            _console_write = lambda msg: tqdm.write(msg, end="")  # noqa: E731
+        except ModuleNotFoundError:
+            import sys
+
+            _console_write = sys.stderr.write
+    _console_write(message)
 
-    logger.add(
-        lambda msg: tqdm.write(msg, end=""), colorize=True, level=Environments.LOGGING_LEVEL.value
-    )
-except ModuleNotFoundError:
-    import sys
 
-    logger.add(sys.stderr, colorize=True, level=Environments.LOGGING_LEVEL.value)
+logger.add(_console_sink, colorize=True, level=Environments.LOGGING_LEVEL.value)
 
 logger.debug(f"Project root directory: {Directories.PROJ_ROOT.value}")
@@ -1,29 +1,32 @@
-from .dataset import (
-    CombinedDiamosDataset,
-    CombinedMegaPlantDataset,
-    CombinedPlantDocDataset,
-    CombinedPlantVillageDataset,
-    DiamosDiseaseDetection,
-    DiamosSymptomIdentification,
-    MegaPlantDataset,
-    PlantDocDiseaseDetection,
-    PlantDocSymptomIdentification,
-    PlantVillageDiseaseDetection,
-    PlantVillageSymptomIdentification,
-    UnhealthyMegaPlantDataset,
-)
+import importlib
 
-__all__ = [
-    "MegaPlantDataset",
-    "UnhealthyMegaPlantDataset",
-    "CombinedMegaPlantDataset",
-    "PlantDocDiseaseDetection",
-    "PlantDocSymptomIdentification",
-    "PlantVillageDiseaseDetection",
-    "PlantVillageSymptomIdentification",
-    "CombinedPlantDocDataset",
-    "CombinedPlantVillageDataset",
-    "DiamosDiseaseDetection",
-    "DiamosSymptomIdentification",
-    "CombinedDiamosDataset",
-]
+# Lazy re-exports (PEP 562): importing lib.data must not eagerly pull in the
+# torch/torchvision/polars import graph behind lib.data.dataset — that cost
+# would otherwise be paid by every process (e.g. DataLoader workers) that only
+# touches a submodule.
+_LAZY = {
+    "MegaPlantDataset": ".dataset",
+    "MaterializedDataset": ".dataset",
+    "UnhealthyMegaPlantDataset": ".dataset",
+    "CombinedMegaPlantDataset": ".dataset",
+    "PlantDocDiseaseDetection": ".dataset",
+    "PlantDocSymptomIdentification": ".dataset",
+    "PlantVillageDiseaseDetection": ".dataset",
+    "PlantVillageSymptomIdentification": ".dataset",
+    "CombinedPlantDocDataset": ".dataset",
+    "CombinedPlantVillageDataset": ".dataset",
+    "DiamosDiseaseDetection": ".dataset",
+    "DiamosSymptomIdentification": ".dataset",
+    "CombinedDiamosDataset": ".dataset",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,30 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 from functools import cached_property
+import itertools
+import os
 from pathlib import Path, PosixPath
-from typing import Optional, Union
+import re
+from types import MappingProxyType
+from typing import ClassVar, Optional, Union
 
-from beartype import beartype
+import numpy as np
 from PIL import Image
+import polars as pl
+import torch
 from torch import Tensor
 from torch.nn import Module
 from torch.utils.data import Dataset
-from torchvision.transforms import Compose
+from torchvision.io import ImageReadMode, decode_image
+from torchvision.transforms import Compose, Resize
+from torchvision.transforms.functional import pil_to_tensor
+
+from lib.config import typecheck
 
 
 class ImageDataset(Dataset, ABC):
-    @beartype
+    @typecheck
     def __init__(
         self,
         data_path: Union[str, Path, PosixPath],
@@ -24,15 +36,24 @@ class ImageDataset(Dataset, ABC):
         self.data_path = data_path
         self.transforms = transforms
 
+    #: Bump to invalidate on-disk index caches when the index schema changes.
+    _INDEX_CACHE_VERSION = 1
+
+    #: Subdirectory of ``data_path`` holding the index caches. Kept out of
+    #: :meth:`_tree_mtime` so one class writing its cache does not bump the
+    #: tree mtime and invalidate a sibling class's cache on the same root.
+    _INDEX_CACHE_DIRNAME = ".index_cache"
+
     @cached_property
-    @abstractmethod
     def data(self) -> list[tuple[Path, int]]:
         """
         List of all dataset samples.
 
-        This property is computed once and cached on first access. It should be
-        implemented by subclasses to return a list of ``(image_path, label)``
-        pairs.
+        This property is computed once and cached on first access. The index
+        is additionally persisted next to ``data_path`` so subsequent
+        processes (e.g. DataLoader workers) skip the filesystem walk; the
+        cache is rebuilt whenever any directory under ``data_path`` is newer
+        than the cache file.
 
         Returns
         -------
@@ -40,8 +61,102 @@ class ImageDataset(Dataset, ABC):
             A list of ``(image_path, label)`` pairs, where ``image_path`` is a
             ``Path`` object and ``label`` is an integer.
         """
+        cached = self._load_index_cache()
+        if cached is not None:
+            return cached
+
+        data = self._build_index()
+        self._write_index_cache(data)
+        return data
+
+    @abstractmethod
+    def _build_index(self) -> list[tuple[Path, int]]:
+        """
+        Walk ``data_path`` and return the full list of ``(image_path, label)``
+        pairs. Implemented by subclasses; called only on a cache miss.
+        """
         pass
 
+    @property
+    def _index_cache_path(self) -> Path:
+        return (
+            self.data_path
+            / self._INDEX_CACHE_DIRNAME
+            / f"{type(self).__name__.lower()}.index.v{self._INDEX_CACHE_VERSION}.parquet"
+        )
+
+    def _tree_mtime(self) -> float:
+        """
+        Most recent modification time of ``data_path`` or any directory below
+        it, excluding the index-cache directory itself: cache writes land in
+        there, so counting it would make each class's cache write invalidate
+        every sibling cache on the same ``data_path``.
+        """
+        mtimes = [os.stat(self.data_path).st_mtime]
+        for root, dirs, _ in os.walk(self.data_path):
+            dirs[:] = [d for d in dirs if d != self._INDEX_CACHE_DIRNAME]
+            mtimes.extend(os.stat(os.path.join(root, d)).st_mtime for d in dirs)
+        return max(mtimes)
+
+    def _load_index_cache(self) -> Optional[list[tuple[Path, int]]]:
+        cache_path = self._index_cache_path
+        if not cache_path.is_file():
+            return None
+        if self._tree_mtime() > cache_path.stat().st_mtime:
+            return None
+
+        df = pl.read_parquet(cache_path)
+        return [(Path(path), label) for path, label in zip(df["path"], df["label"])]
+
+    def _write_index_cache(self, data: list[tuple[Path, int]]) -> None:
+        df = pl.DataFrame(
+            {
+                "path": [str(path) for path, _ in data],
+                "label": [label for _, label in data],
+            },
+            schema={"path": pl.String, "label": pl.Int32},
+        )
+        # Best effort: read-only dataset directories simply skip the cache.
+        with contextlib.suppress(OSError):
+            cache_path = self._index_cache_path
+            cache_path.parent.mkdir(exist_ok=True)
+            df.write_parquet(cache_path)
+
+    @cached_property
+    def _index(self) -> tuple[bytes, np.ndarray, np.ndarray]:
+        """
+        Struct-of-arrays view of ``data``: one contiguous ``bytes`` buffer of
+        NUL-separated encoded paths, ``int64`` offsets into it, and a
+        contiguous ``int64`` array of labels. A ``Path`` object costs ~200
+        bytes of PyObject overhead per sample; packing the strings into a
+        single buffer shrinks the index roughly tenfold and keeps its pages
+        clean across ``fork()`` in DataLoader workers. ``Path`` objects are
+        materialized lazily per lookup in :meth:`_path_at`.
+        """
+        samples = self.data
+        encoded = [os.fsencode(path) for path, _ in samples]
+        lengths = np.fromiter(
+            (len(path) + 1 for path in encoded), dtype=np.int64, count=len(encoded)
+        )
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buffer = b"\0".join(encoded) + b"\0" if encoded else b""
+        labels = np.fromiter((label for _, label in samples), dtype=np.int64, count=len(samples))
+        # Evict the tuple/Path list now that it is packed — keeping both
+        # views pinned would grow resident memory instead of shrinking it.
+        # ``data`` can rebuild from the parquet cache if accessed again.
+        self.__dict__.pop("data", None)
+        return buffer, offsets, labels
+
+    def _path_at(self, idx: int) -> Path:
+        """Materialize the ``Path`` for sample ``idx`` from the packed buffer."""
+        buffer, offsets, _ = self._index
+        return Path(os.fsdecode(buffer[offsets[idx] : offsets[idx + 1] - 1]))
+
+    @property
+    def _labels(self) -> np.ndarray:
+        return self._index[2]
+
     def __len__(self):
         """
         Return the number of samples in the dataset.
@@ -51,18 +166,18 @@ class ImageDataset(Dataset, ABC):
         int
             Total number of images across all classes.
         """
-        return len(self.data)
+        return self._labels.size
 
-    def __getitem__(
-        self, idx
-    ) -> Union[tuple[Tensor, int], tuple[Image.Image, int], tuple[Union[Path, PosixPath], int]]:
+    def __getitem__(self, idx) -> Union[tuple[Tensor, int], tuple[Union[Path, PosixPath], int]]:
         """
         Retrieve a single dataset sample.
 
-        Loads an RGB image from disk and applies the optional transformation.
-        If no transformations are provided, the method returns the image path
-        instead of the loaded image. This allows lazy loading or custom
-        processing pipelines.
+        Decodes the image from disk into an RGB ``uint8`` tensor of shape
+        ``(3, H, W)`` via ``torchvision.io`` (libjpeg-turbo under the hood)
+        and applies the optional transformation. Formats torchvision cannot
+        decode fall back to PIL. If no transformations are provided, the
+        method returns the image path instead of the decoded image. This
+        allows lazy loading or custom processing pipelines.
 
         Parameters
         ----------
@@ -71,29 +186,43 @@ class ImageDataset(Dataset, ABC):
 
         Returns
         -------
-        tuple[Union[Image.Image, Tensor, Path, PosixPath], int]
+        tuple[Union[Tensor, Path, PosixPath], int]
             If ``transforms`` is provided:
-                ``(image, label)`` where ``image`` is a PIL ``Image`` or the
-                output of the transform, and ``label`` is an integer.
+                ``(image, label)`` where ``image`` is the output of the
+                transform applied to the decoded ``uint8`` tensor, and
+                ``label`` is an integer.
 
             If ``transforms`` is None:
                 ``(image_path, label)`` where ``image_path`` is a ``Path`` object.
         """
-        image_path, label = self.data[idx]
+        image_path = self._path_at(idx)
+        label = int(self._labels[idx])
         if self.transforms:
-            image = Image.open(image_path).convert("RGB")
+            try:
+                image = decode_image(os.fspath(image_path), mode=ImageReadMode.RGB)
+            except RuntimeError:
+                image = pil_to_tensor(Image.open(image_path).convert("RGB"))
             return self.transforms(image), label
         else:
             return image_path, label
 
-    def find_subfiles(self, dir: Path) -> list[Path]:
+    def find_subfiles(self, dir: Path, suffixes: Optional[set[str]] = None) -> list[Path]:
         """
-        Recursively find all files in a directory and its subdirectories.
+        Find all files in a directory and its subdirectories.
+
+        Uses an iterative ``os.scandir`` walk so file/directory checks are
+        answered from the cached ``DirEntry`` records instead of issuing an
+        extra ``stat()`` syscall per entry.
 
         Parameters
         ----------
         dir : Path
             The root directory to search for files.
+        suffixes : set of str, optional
+            Lowercased extensions without the dot, e.g. ``{"jpg", "png"}``.
+            When given, non-matching entries are rejected on the raw entry
+            name before a ``Path`` object is ever allocated, which is much
+            cheaper than filtering on ``Path.suffix`` afterwards.
 
         Returns
         -------
@@ -101,30 +230,75 @@ class ImageDataset(Dataset, ABC):
             A list of ``Path`` objects representing all files found within
             the directory and its subdirectories.
         """
+        if not dir.is_dir():
+            raise ValueError(f"{dir} is not a valid directory.")
+
         files = []
+        stack = [os.fspath(dir)]
 
-        if dir.is_dir():
-            for item in dir.iterdir():
-                if item.is_file():
-                    files.append(item)
-                elif item.is_dir():
-                    files.extend(self.find_subfiles(item))
-        else:
-            raise ValueError(f"{dir} is not a valid directory.")
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if suffixes is None or entry.name.rpartition(".")[2].lower() in suffixes:
+                            files.append(Path(entry.path))
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
 
         return files
 
-    @property
-    def SYMPTOM_MAP(self) -> dict[str, int]:
+    def materialize(
+        self,
+        out_dir: Union[str, Path],
+        shape: tuple[int, int, int] = (3, 32, 32),
+    ) -> Path:
         """
-        Mapping of integer labels to symptom names for unhealthy plants.
+        Decode and resize every sample once, caching the results on disk.
+
+        Re-decoding JPEGs every epoch is redundant work; this writes all
+        images into a single memory-mapped ``uint8`` array of shape
+        ``(N, C, H, W)`` plus a sibling ``labels.npy``, which
+        ``MaterializedDataset`` can then serve with a single mmap page read
+        per sample.
+
+        Parameters
+        ----------
+        out_dir : str or Path
+            Directory where ``images.npy`` and ``labels.npy`` are written.
+        shape : tuple of int, optional
+            Target ``(C, H, W)`` of the cached tensors. Defaults to
+            ``(3, 32, 32)``, the input shape of ``SimpleCNN``.
 
         Returns
         -------
-        dict of int to str
-            Dictionary mapping integer labels to symptom names.
+        Path
+            The output directory.
         """
-        return {
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        total = len(self)
+        resize = Resize(shape[1:], antialias=True)
+        images = np.lib.format.open_memmap(
+            out_dir / "images.npy", mode="w+", dtype=np.uint8, shape=(total, *shape)
+        )
+
+        for idx in range(total):
+            image_path = self._path_at(idx)
+            try:
+                image = decode_image(os.fspath(image_path), mode=ImageReadMode.RGB)
+            except RuntimeError:
+                image = pil_to_tensor(Image.open(image_path).convert("RGB"))
+            images[idx] = resize(image).numpy()
+
+        images.flush()
+        np.save(out_dir / "labels.npy", self._labels)
+        return out_dir
+
+    #: Mapping of symptom names to integer labels for unhealthy plants.
+    #: Frozen at class level so index building never re-allocates it per access.
+    SYMPTOM_MAP: ClassVar[MappingProxyType] = MappingProxyType(
+        {
             "blight": 0,
             "yellowing": 1,
             "malformation": 2,
@@ -138,6 +312,7 @@ class ImageDataset(Dataset, ABC):
             "spot": 10,
             "scorch": 11,
         }
+    )
 
 
 class MegaPlantDataset(ImageDataset):
@@ -187,26 +362,11 @@ class MegaPlantDataset(ImageDataset):
         Mapping from class folder names to numerical labels.
     """
 
-    @beartype
-    def __init__(
-        self,
-        data_path: Union[str, Path, PosixPath],
-        transforms: Optional[Union[Compose, Module]] = None,
-    ):
-        if isinstance(data_path, str):
-            data_path = Path(data_path)
-
-        self.data_path = data_path
-        self.transforms = transforms
-
-    @cached_property
-    def data(self):
+    def _build_index(self):
         """
-        List of all dataset samples.
-
-        This property is computed once and cached on first access. It iterates
-        over all class subdirectories defined in ``STATUS_MAP`` and collects
-        image paths paired with their corresponding integer labels.
+        Build the sample index by iterating over all class subdirectories
+        defined in ``STATUS_MAP`` and collecting image paths paired with
+        their corresponding integer labels.
 
         Returns
         -------
@@ -214,34 +374,54 @@ class MegaPlantDataset(ImageDataset):
             A list of ``(image_path, label)`` pairs, where ``image_path`` is a
             ``Path`` object and ``label`` is an integer.
         """
-        healthy_files = self.find_subfiles(self.data_path / "healthy")
-        unhealthy_files = self.find_subfiles(self.data_path / "unhealthy")
+        # Directory walking is syscall-bound, so the class trees are scanned
+        # on separate threads.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = executor.map(
+                lambda class_name: [
+                    (image_path, self.STATUS_MAP[class_name])
+                    for image_path in self.find_subfiles(self.data_path / class_name)
+                ],
+                self.STATUS_MAP,
+            )
+            return list(itertools.chain.from_iterable(results))
 
-        data = []
-
-        for image_path in healthy_files:
-            data.append((image_path, self.STATUS_MAP["healthy"]))
+    @cached_property
+    def _symptom_pattern(self) -> re.Pattern:
+        """Single precompiled alternation over all symptom names."""
+        return re.compile("|".join(re.escape(symptom) for symptom in self.SYMPTOM_MAP))
 
-        for image_path in unhealthy_files:
-            data.append((image_path, self.STATUS_MAP["unhealthy"]))
+    def resolve_class(self, folder_name: str) -> int:
+        """
+        Map a source class-folder name to a ``STATUS_MAP`` label.
 
-        return data
+        Folder names that mention any known symptom resolve to
+        ``unhealthy``; everything else is treated as ``healthy``. A single
+        precompiled regex replaces scanning each symptom name per call, and
+        the result is meant to be resolved once per directory rather than
+        once per file.
 
-    @property
-    def STATUS_MAP(self) -> dict[str, int]:
-        """
-        Mapping of class names to integer labels.
+        Parameters
+        ----------
+        folder_name : str
+            Name of the class folder, e.g. ``"Tomato_early_blight"``.
 
         Returns
         -------
-        dict of str to int
-            Dictionary assigning ``0`` to ``"healthy"`` and ``1`` to
-            ``"unhealthy"``.
+        int
+            The ``STATUS_MAP`` label for the folder.
         """
-        return {
+        if self._symptom_pattern.search(folder_name.lower()):
+            return self.STATUS_MAP["unhealthy"]
+        return self.STATUS_MAP["healthy"]
+
+    #: Mapping of class names to integer labels.
+    STATUS_MAP: ClassVar[MappingProxyType] = MappingProxyType(
+        {
             "healthy": 0,
             "unhealthy": 1,
         }
+    )
 
 
 class UnhealthyMegaPlantDataset(MegaPlantDataset):
@@ -264,20 +444,25 @@ class UnhealthyMegaPlantDataset(MegaPlantDataset):
         scorch/
     """
 
-    @cached_property
-    def data(self) -> list[tuple[Path, int]]:
+    def _build_index(self) -> list[tuple[Path, int]]:
         """
-        List of all dataset samples for unhealthy plants.
+        Build the sample index for unhealthy plants.
         """
-        data = []
-        for symptom in self.SYMPTOM_MAP.keys():
+
+        def scan_symptom(symptom: str) -> list[tuple[Path, int]]:
             class_path = self.data_path / "unhealthy" / symptom
             if not class_path.exists():
-                continue
-            for image_path in class_path.iterdir():
-                if image_path.is_file():
-                    data.append((image_path, self.SYMPTOM_MAP[symptom]))
-        return data
+                return []
+            with os.scandir(class_path) as entries:
+                return [
+                    (Path(entry.path), self.SYMPTOM_MAP[symptom])
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                ]
+
+        with ThreadPoolExecutor(max_workers=min(16, len(self.SYMPTOM_MAP))) as executor:
+            results = executor.map(scan_symptom, self.SYMPTOM_MAP)
+            return list(itertools.chain.from_iterable(results))
 
 
 class CombinedMegaPlantDataset(UnhealthyMegaPlantDataset):
@@ -285,32 +470,27 @@ class CombinedMegaPlantDataset(UnhealthyMegaPlantDataset):
     Combined dataset class for loading both unhealthy symptoms and healthy plant images.
     """
 
-    @cached_property
-    def data(self) -> list[tuple[Path, int]]:
+    def _build_index(self) -> list[tuple[Path, int]]:
         """
-        List of all dataset samples for both healthy and unhealthy plants.
+        Build the sample index for both healthy and unhealthy plants.
         """
-        data = super().data  # Get unhealthy data from parent class
-        healthy_files = self.find_subfiles(self.data_path / "healthy")
-        data.extend((image_path, self.CLASS_MAP["healthy"]) for image_path in healthy_files)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Overlap the healthy scan with the symptom scans from the parent.
+            healthy_future = executor.submit(self.find_subfiles, self.data_path / "healthy")
+            data = super()._build_index()  # Get unhealthy data from parent class
+            data.extend(
+                (image_path, self.CLASS_MAP["healthy"]) for image_path in healthy_future.result()
+            )
         return data
 
-    @property
-    def CLASS_MAP(self) -> dict[str, int]:
-        """
-        Mapping of class names to integer labels for both healthy and unhealthy plants.
-
-        Returns
-        -------
-        dict of str to int
-            Dictionary assigning integer labels to symptom names and "healthy".
-        """
-        max_class = max(self.SYMPTOM_MAP.values()) + 1
-
-        return {
-            **self.SYMPTOM_MAP,
-            "healthy": max_class,
+    #: Mapping of class names to integer labels for both healthy and unhealthy
+    #: plants: all symptom labels plus "healthy" as the next free label.
+    CLASS_MAP: ClassVar[MappingProxyType] = MappingProxyType(
+        {
+            **ImageDataset.SYMPTOM_MAP,
+            "healthy": max(ImageDataset.SYMPTOM_MAP.values()) + 1,
         }
+    )
 
 
 class PlantDocDiseaseDetection(MegaPlantDataset):
@@ -365,3 +545,46 @@ class CombinedDiamosDataset(CombinedMegaPlantDataset):
     """
     Dataset class for loading both healthy and unhealthy plant images from the Diamos dataset.
     """
+
+
+class MaterializedDataset(Dataset):
+    """
+    Dataset backed by tensors cached with ``ImageDataset.materialize``.
+
+    ``__getitem__`` reads a pre-decoded, pre-resized ``uint8`` tensor out of
+    a memory-mapped array and scales it to ``[0, 1]`` floats, so the per-epoch
+    JPEG decode and resize disappear entirely. Non-deterministic transforms
+    (augmentation) can still be applied on top via ``transforms``.
+
+    Parameters
+    ----------
+    data_path : str or Path
+        Directory produced by ``ImageDataset.materialize`` containing
+        ``images.npy`` and ``labels.npy``.
+    transforms : callable, optional
+        Applied to the float tensor of each sample.
+    """
+
+    @typecheck
+    def __init__(
+        self,
+        data_path: Union[str, Path, PosixPath],
+        transforms: Optional[Union[Compose, Module]] = None,
+    ):
+        if isinstance(data_path, str):
+            data_path = Path(data_path)
+
+        self.data_path = data_path
+        self.transforms = transforms
+        self.images = np.load(data_path / "images.npy", mmap_mode="r")
+        self.labels = np.load(data_path / "labels.npy")
+
+    def __len__(self):
+        return self.labels.size
+
+    def __getitem__(self, idx) -> tuple[Tensor, int]:
+        image = torch.from_numpy(np.array(self.images[idx])).float().div_(255)
+        label = int(self.labels[idx])
+        if self.transforms:
+            image = self.transforms(image)
+        return image, label
@@ -1,6 +1,3 @@
-import questionary
-from questionary import Choice
-
 from .base_menu import BaseMenu
 from .deduplicate_files import DeduplicateFilesMenu
 from .download_dataset import DownloadDatasetMenu
@@ -10,6 +7,11 @@ from .splitter_menu import SplitterMenu
 
 class AppMenu(BaseMenu):
     def menu(self) -> None:
+        # Imported here so loading the menu package stays cheap; questionary
+        # is only needed once the interactive menu actually runs.
+        import questionary
+        from questionary import Choice
+
         while True:
             choice = questionary.select(
                 f"{self.breadcrumbs} >",
@@ -1,7 +1,5 @@
 from pathlib import Path
 
-import questionary
-
 from lib.config import Directories, logger
 from lib.data.utils import Deduplicator
 
@@ -10,6 +8,9 @@ from .base_menu import BaseMenu
 
 class DeduplicateFilesMenu(BaseMenu):
     def menu(self) -> None:
+        # Deferred; only needed once this menu actually runs.
+        import questionary
+
         folder_path = questionary.path(
             "Enter the path to save the flood control dataset:",
             default=str(Directories.INTERIM_DATA_DIR.value / "leaves"),
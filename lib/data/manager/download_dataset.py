@@ -1,8 +1,5 @@
 import zipfile
 
-import questionary
-from tqdm import tqdm
-
 from lib.config import logger
 from lib.data.storage import HuggingFace
 
@@ -11,6 +8,11 @@ from .base_menu import BaseMenu
 
 class DownloadDatasetMenu(BaseMenu):
     def menu(self) -> None:
+        # Imported here so loading the menu package stays cheap; these are
+        # only needed once the user actually opens this menu.
+        import questionary
+        from tqdm import tqdm
+
         datasets = {
             dataset.__name__: dataset
             for dataset in [
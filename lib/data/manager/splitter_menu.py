@@ -1,18 +1,24 @@
 from pathlib import Path
 
-import questionary
+import numpy as np
 
 from lib.config import Directories, logger
 
 from ..utils import mega_plant_split
 from .base_menu import BaseMenu
 
+# Folded once at import time; the enum value never changes.
+_LEAVES_DIR = Directories.INTERIM_DATA_DIR.value / "leaves"
+
 
 class SplitterMenu(BaseMenu):
     def menu(self) -> None:
+        # Deferred; only needed once this menu actually runs.
+        import questionary
+
         data_path = questionary.path(
             "Enter the path to the MegaPlant dataset:",
-            default=str(Directories.INTERIM_DATA_DIR.value / "leaves"),
+            default=str(_LEAVES_DIR),
         ).ask()
 
         if data_path is None:
@@ -54,7 +60,9 @@ class SplitterMenu(BaseMenu):
         if split_ratio_str is None:
             return
 
-        split_ratio = [float(ratio) for ratio in split_ratio_str.split()]
+        # tolist() hands the validator Python floats: summing numpy scalars
+        # accumulates differently and "0.7 0.2 0.1" would no longer sum to 1.0.
+        split_ratio = np.array(split_ratio_str.split(), dtype=np.float64).tolist()
         mega_plant_split(
             data=Path(data_path),
             split_ratio=split_ratio,
@@ -1,6 +1,7 @@
+import asyncio
+import io
 import os
 from pathlib import Path
-import tempfile
 from typing import Union
 
 from huggingface_hub import HfApi
@@ -17,7 +18,9 @@ class HuggingFace(Storage):
         self.token = token
         self.api = HfApi(token=token)
 
-    def save(self, data: Union[DataFrame, Path, str], repo_id: str) -> bool:
+    def save(
+        self, data: Union[DataFrame, Path, str, list[Union[Path, str]]], repo_id: str
+    ) -> bool:
         """
         Save data to a Hugging Face repository.
 
@@ -28,10 +31,11 @@ class HuggingFace(Storage):
 
         Parameters
         ----------
-        data : polars.DataFrame | pathlib.Path | str
+        data : polars.DataFrame | pathlib.Path | str | list of Path or str
             The data to save. If a Polars DataFrame is provided, it will be serialized
             and uploaded via the DataFrame-saving routine. If a Path or string is
             provided, it is treated as a filesystem path to a file that will be uploaded.
+            A list of paths uploads all files concurrently (_save_files).
         repo_id : str
             The identifier of the Hugging Face repository (for example "username/repo")
             where the data should be stored.
@@ -68,6 +72,9 @@ class HuggingFace(Storage):
         >>> client.save("/path/to/file.csv", "myuser/myrepo")
         """
         logger.debug(f"Input data type for saving: {type(data)}")
+        if isinstance(data, (list, tuple)):
+            return self._save_files(data, repo_id)
+
         if isinstance(data, (Path, str)):
             return self._save_file(data, repo_id)
 
@@ -76,7 +83,45 @@ class HuggingFace(Storage):
 
         raise ValueError("Data must be either a Polars DataFrame or a file path.")
 
-    def _save_dataframe(self, df: DataFrame, repo_id: str) -> bool:
+    async def save_async(self, items: list[tuple[Union[DataFrame, Path, str], str]]) -> bool:
+        """
+        Save several items concurrently from asyncio code.
+
+        Each ``(data, repo_id)`` pair goes through the synchronous
+        :meth:`save` on a worker thread and all of them are awaited together,
+        so independent uploads overlap instead of blocking the event loop
+        one at a time.
+
+        Parameters
+        ----------
+        items : list of tuple
+            ``(data, repo_id)`` pairs, where ``data`` is anything
+            :meth:`save` accepts.
+
+        Returns
+        -------
+        bool
+            True once every upload has completed successfully.
+
+        Notes
+        -----
+        The hub client's own transfer machinery (chunking, retries, LFS
+        preupload) is reused as-is rather than re-implemented over a raw
+        HTTP session; the concurrency win comes purely from overlapping the
+        blocking calls.
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.save, data, repo_id) for data, repo_id in items)
+        )
+        return all(results)
+
+    def _save_dataframe(
+        self,
+        df: DataFrame,
+        repo_id: str,
+        format: str = "parquet",
+        name: str = "data",
+    ) -> bool:
         """
         Save a Polars DataFrame to a HuggingFace dataset repository.
 
@@ -86,22 +131,87 @@ class HuggingFace(Storage):
             The Polars DataFrame to save.
         repo_id : str
             Identifier of the remote repository (dataset) to which the DataFrame will be uploaded.
+        format : str, optional
+            Serialization format, ``"parquet"`` (default) or ``"csv"``.
+        name : str, optional
+            Filename stem used for the file in the repository. Defaults to ``"data"``.
 
         Returns
         -------
         bool
             True if the upload was initiated/completed successfully.
 
+        Raises
+        ------
+        ValueError
+            If `format` is not ``"parquet"`` or ``"csv"``.
+
         Notes
         -----
-        The DataFrame is first saved to a temporary CSV file, which is then uploaded
-        to the specified HuggingFace dataset repository using `self.api.upload_file`.
-        The temporary file is deleted after the upload.
+        The DataFrame is serialized into an in-memory buffer and uploaded
+        directly via `self.api.upload_file`, skipping the temp-file round trip.
+        Zstd-compressed Parquet is typically 5-20x smaller than CSV, so both
+        memory traffic and bytes over the wire drop accordingly.
         """
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=True) as tmp_file:
-            logger.debug(f"Saving DataFrame to temporary file: {tmp_file.name}")
-            df.write_csv(tmp_file.name)
-            self._save_file(Path(tmp_file.name), repo_id)
+        buffer = io.BytesIO()
+        match format:
+            case "parquet":
+                df.write_parquet(buffer, compression="zstd")
+            case "csv":
+                df.write_csv(buffer)
+            case _:
+                raise ValueError(f"Unsupported DataFrame format: {format}")
+        buffer.seek(0)
+
+        logger.debug(f"Uploading DataFrame as {name}.{format} to repo {repo_id}")
+        self.api.upload_file(
+            path_or_fileobj=buffer,
+            path_in_repo=f"{name}.{format}",
+            repo_id=repo_id,
+            repo_type="dataset",
+        )
+
+        return True
+
+    def _save_files(self, files: list[Union[Path, str]], repo_id: str) -> bool:
+        """
+        Upload multiple files concurrently to a HuggingFace dataset repository.
+
+        Parameters
+        ----------
+        files : list of Path or str
+            Paths of the files to upload.
+        repo_id : str
+            Identifier of the remote repository (dataset) to which the files will be uploaded.
+
+        Returns
+        -------
+        bool
+            True once every upload future has completed.
+
+        Notes
+        -----
+        Uploads are network-bound, so each one is submitted with
+        ``run_as_future=True`` and the transfers overlap instead of paying
+        the full round-trip latency per file.
+        """
+        futures = []
+        for file in files:
+            file = self.resolve_path(file)
+            self.validate_file(file)
+            logger.debug(f"Uploading file {file} to repo {repo_id}")
+            futures.append(
+                self.api.upload_file(
+                    path_or_fileobj=file,
+                    path_in_repo="/",
+                    repo_id=repo_id,
+                    repo_type="dataset",
+                    run_as_future=True,
+                )
+            )
+
+        for future in futures:
+            future.result()
 
         return True
 
@@ -149,9 +259,9 @@ class HuggingFace(Storage):
         Download a file from a Hugging Face dataset repository and save it into a local directory.
 
         This method uses the instance's `api.hf_hub_download` to fetch `filename` from the dataset
-        repository identified by `repo_id` (repo_type="dataset"). The downloaded file is copied
-        into `save_dir` (created if necessary) using `copy_file_to_directory` with mode "hardlink",
-        and then renamed to `filename` inside `save_dir`. The returned Path points to the saved file.
+        repository identified by `repo_id` (repo_type="dataset"), materializing it directly inside
+        `save_dir` (created if necessary) via `local_dir`. The returned Path points to the saved
+        file.
 
         Args:
             repo_id (str): The identifier of the Hugging Face dataset repository (e.g. "owner/dataset").
@@ -165,27 +275,32 @@ class HuggingFace(Storage):
         Raises:
             Exception: If the downloaded file does not exist after `hf_hub_download`.
             Any exception raised by `self.api.hf_hub_download`, `self.resolve_path`, `Path.mkdir`,
-            `copy_file_to_directory`, `Path.rename`, or underlying OS calls may propagate (e.g. OSError,
-            PermissionError). Note that behavior of `Path.rename` regarding overwriting an existing
-            target file can be platform-dependent.
+            or underlying OS calls may propagate (e.g. OSError, PermissionError).
 
         Side effects:
             - Creates `save_dir` if it does not exist.
-            - Attempts to create a hard link to the downloaded file in `save_dir` (via
-              `copy_file_to_directory` with mode "hardlink"). If hardlinking is not possible,
-              the implementation of `copy_file_to_directory` may fall back to copying.
-            - Renames the stored file to `filename` inside `save_dir`.
+            - Writes the downloaded file (and the hub's metadata bookkeeping) into `save_dir`.
 
         Example:
             >>> storage.load("owner/dataset", "data.csv")
             PosixPath("/abs/path/to/external_data/huggingface/data.csv")
+
+        Notes:
+            Passing `local_dir` makes the hub materialize the file at its final
+            location in one step; the previous cache-then-hardlink-then-rename
+            dance cost three filesystem operations per download for the same
+            result.
         """
-        logger.debug(f"Downloading file {filename} from repo {repo_id}")
+        save_dir = self.resolve_path(save_dir)
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.debug(f"Downloading file {filename} from repo {repo_id} into {save_dir}")
         downloaded_file = Path(
             self.api.hf_hub_download(
                 repo_id=repo_id,
                 repo_type="dataset",
                 filename=filename,
+                local_dir=save_dir,
             )
         ).resolve()
 
@@ -194,21 +309,4 @@ class HuggingFace(Storage):
         if not downloaded_file.exists():
             raise Exception(f"Failed to download file {filename} from repo {repo_id}.")
 
-        save_dir = self.resolve_path(save_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
-
-        saved_file = self.copy_file_to_directory(
-            source_file=downloaded_file,
-            target_directory=save_dir,
-            mode="hardlink",
-        )
-        new_name = save_dir / filename
-
-        if new_name.exists():
-            new_name.unlink()
-            logger.debug(f"Existing file {new_name} deleted before renaming.")
-
-        logger.debug(f"Renaming saved file {saved_file} to {new_name}")
-
-        saved_file.rename(new_name)
-        return new_name
+        return downloaded_file
@@ -1,5 +1,5 @@
 from .deduplicator import Deduplicator
-from .misc import get_files
+from .misc import get_files, iter_file_stats, iter_files
 from .splitter import mega_plant_split
 
-__all__ = ["Deduplicator", "get_files", "mega_plant_split"]
+__all__ = ["Deduplicator", "get_files", "iter_file_stats", "iter_files", "mega_plant_split"]
@@ -1,12 +1,98 @@
+import os
 from pathlib import Path
+from typing import Iterator
 
 from lib.config import logger
 
 
+def iter_file_stats(folder: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Recursively stream ``(path, stat_result)`` pairs for all files in a folder.
+
+    Parameters
+    ----------
+    folder : Path
+        Root folder to scan.
+
+    Yields
+    ------
+    tuple of (Path, os.stat_result)
+        Path and stat record of every file in the folder (recursively),
+        as it is found.
+
+    Raises
+    ------
+    ValueError
+        If the provided path points to a file rather than a folder.
+        Raised immediately, not on first iteration.
+
+    Notes
+    -----
+    Traversal is an iterative depth-first walk over ``os.scandir``, so the
+    file/directory checks and the stat record are answered from the cached
+    ``DirEntry`` instead of costing a fresh ``stat()`` per entry, and pairs
+    are yielded as they are found so memory stays constant even for
+    million-file trees. Entries within each directory are visited in name
+    order: raw readdir order is arbitrary, and a stable listing keeps
+    order-dependent callers (for example the ``keep_first``/``keep_last``
+    dedup strategies) deterministic.
+    """
+    if folder.is_file():
+        logger.debug(f"Provided path is a file: {folder}")
+        raise ValueError("The provided path is a file, expected a folder.")
+
+    def walk() -> Iterator[tuple[Path, os.stat_result]]:
+        stack = [os.fspath(folder)]
+        while stack:
+            subdirs = []
+            with os.scandir(stack.pop()) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path), entry.stat(follow_symlinks=False)
+                    elif entry.is_dir(follow_symlinks=False):
+                        # Lazy: skips formatting entirely when no sink wants DEBUG.
+                        logger.opt(lazy=True).debug("Found subfolder: {}", lambda p=entry.path: p)
+                        subdirs.append(entry.path)
+            # Reversed so the LIFO stack pops subdirectories in name order,
+            # giving a strict pre-order DFS at every level.
+            stack.extend(reversed(subdirs))
+
+    return walk()
+
+
+def iter_files(folder: Path) -> Iterator[Path]:
+    """
+    Recursively stream all files within a folder.
+
+    Thin path-only view over :func:`iter_file_stats` for callers that do
+    not need the stat records.
+
+    Parameters
+    ----------
+    folder : Path
+        Root folder to scan.
+
+    Yields
+    ------
+    Path
+        Path of every file in the folder (recursively), as it is found.
+
+    Raises
+    ------
+    ValueError
+        If the provided path points to a file rather than a folder.
+        Raised immediately, not on first iteration.
+    """
+    return (path for path, _ in iter_file_stats(folder))
+
+
 def get_files(folder: Path) -> list[Path]:
     """
     Recursively collect all files within a folder.
 
+    Thin list-materializing wrapper over :func:`iter_files` for callers
+    that need the whole manifest at once (for example shuffling).
+
     Parameters
     ----------
     folder : Path
@@ -22,28 +108,10 @@ def get_files(folder: Path) -> list[Path]:
     ValueError
         If the provided path points to a file rather than a folder.
 
-    Notes
-    -----
-    Subdirectories are traversed depth-first.
-
     Examples
     --------
-    >>> files = Deduplicator.get_files(Path("dataset"))
+    >>> files = get_files(Path("dataset"))
     >>> len(files)
     128
     """
-    all_files = []
-
-    if folder.is_file():
-        logger.debug(f"Provided path is a file: {folder}")
-        raise ValueError("The provided path is a file, expected a folder.")
-
-    for file_path in folder.iterdir():
-        if file_path.is_file():
-            all_files.append(file_path)
-
-        if file_path.is_dir():
-            logger.debug(f"Found subfolder: {file_path}")
-            all_files.extend(get_files(file_path))
-
-    return all_files
+    return list(iter_files(folder))
@@ -1,12 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+import math
+import os
 from pathlib import Path
-import random
+import platform
 from typing import Optional
 
+import numpy as np
 from tqdm import tqdm
 
 from lib.config import logger
 
-from .misc import get_files
+from .misc import iter_files
+
+_ALLOWED_SPLIT_COUNTS = frozenset({2, 3})
+_CLASSES = ("unhealthy", "healthy")
+
+
+@dataclass(frozen=True)
+class Samples:
+    """
+    Structure-of-arrays image manifest.
+
+    Two parallel arrays instead of a list of ``(path, label)`` tuples:
+    per sample this costs one object pointer plus one int8 code rather
+    than a tuple, a string pointer and an interned label, and class
+    filters become a single vectorized ``labels == code`` compare.
+
+    Attributes
+    ----------
+    paths : np.ndarray
+        Object array of path strings.
+    labels : np.ndarray
+        int8 array of class codes, indexing into ``classes``.
+    classes : tuple of str
+        Class names; ``classes[labels[i]]`` is the label of ``paths[i]``.
+    """
+
+    paths: np.ndarray
+    labels: np.ndarray
+    classes: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.paths)
 
 
 def mega_plant_split(
@@ -56,6 +94,9 @@ def mega_plant_split(
     -----
     - Hardlinks require the source and destination to be on the same filesystem.
     - Uses ``tqdm`` to show progress during file linking.
+    - Splits are stratified: each class is shuffled and sliced
+      independently, so every split reproduces the requested ratios per
+      class instead of leaving the class balance to chance.
     """
     _validate_split_ratio(split_ratio)
 
@@ -63,15 +104,22 @@ def mega_plant_split(
     logger.info(f"Number of splits: {split_count}")
 
     split_root = _create_split_root(destination)
-    all_images = _load_images(data)
-
-    if seed is not None:
-        random.seed(seed)
-
-    random.shuffle(all_images)
-    logger.info(f"Total images found: {len(all_images)}")
+    samples = _load_images(data)
+    logger.info(f"Total images found: {len(samples)}")
+
+    rng = np.random.default_rng(seed)
+    names = ("train", "val") if split_count == 2 else ("train", "val", "test")
+    splits: dict[str, list[tuple[str, str]]] = {name: [] for name in names}
+
+    for code, class_name in enumerate(samples.classes):
+        # Select, permute and partition each class entirely in numpy: one
+        # vectorized compare picks the class, one permutation shuffles it,
+        # and one fancy-index per split routes the paths into place.
+        class_indices = rng.permutation(np.flatnonzero(samples.labels == code))
+        for name, part in _compute_split_indices(len(class_indices), split_ratio).items():
+            chosen = samples.paths[class_indices[part]]
+            splits[name].extend((path, class_name) for path in chosen)
 
-    splits = _compute_splits(all_images, split_ratio)
     _write_splits(split_root, splits)
 
 
@@ -95,13 +143,17 @@ def _validate_split_ratio(split_ratio: list[float]) -> None:
         or if the list length is not 2 or 3.
     """
 
-    if sum(split_ratio) != 1.0:
-        raise ValueError(f"Split ratios must sum to 1.0, but sum to {sum(split_ratio)}")
+    # fsum tracks partial sums exactly, and the tolerance keeps valid
+    # ratios like [0.7, 0.2, 0.1] (binary sum 0.9999999999999999) from
+    # being rejected by exact float equality.
+    total = math.fsum(split_ratio)
+    if abs(total - 1.0) > 1e-9:
+        raise ValueError(f"Split ratios must sum to 1.0, but sum to {total}")
 
     if any(r <= 0 for r in split_ratio):
         raise ValueError("Split ratios must be greater than 0.0")
 
-    if len(split_ratio) not in {2, 3}:
+    if len(split_ratio) not in _ALLOWED_SPLIT_COUNTS:
         raise ValueError(f"Split ratio must have length 2 or 3, but got length {len(split_ratio)}")
 
 
@@ -109,6 +161,9 @@ def _create_split_root(destination: Path) -> Path:
     """
     Create the output split directory.
 
+    Creation is memoized on the resolved path, so per-batch callers in a
+    loop pay the mkdir/stat round trip only once per destination.
+
     Parameters
     ----------
     destination : Path
@@ -119,12 +174,17 @@ def _create_split_root(destination: Path) -> Path:
     Path
         The created directory path.
     """
-    split_root = destination
+    return _create_split_root_cached(os.fspath(Path(destination).resolve()))
+
+
+@lru_cache(maxsize=128)
+def _create_split_root_cached(destination: str) -> Path:
+    split_root = Path(destination)
     split_root.mkdir(parents=True, exist_ok=True)
     return split_root
 
 
-def _load_images(data: Path) -> list[tuple[Path, str]]:
+def _load_images(data: Path) -> Samples:
     """
     Load all images from the dataset, labeling them by class.
 
@@ -135,50 +195,60 @@ def _load_images(data: Path) -> list[tuple[Path, str]]:
 
     Returns
     -------
-    list of tuple
-        Each tuple contains ``(image_path, class_name)``.
-    """
-    all_images = []
-
-    for class_name in ["unhealthy", "healthy"]:
-        class_path = data / class_name
-        for image in get_files(class_path):
-            all_images.append((image, class_name))
+    Samples
+        Structure-of-arrays manifest of path strings and int8 class codes.
 
-    return all_images
+    Notes
+    -----
+    Paths are kept as plain strings until link time: a ``str`` is about a
+    third the size of a ``Path``, which matters when the manifest holds
+    hundreds of thousands of entries. Each symptom subfolder is walked on
+    its own thread so readdir latency overlaps across the ~10 subfolders
+    per class; macOS keeps the serial walk because APFS serializes
+    ``readdir`` in-kernel, so concurrent walks just contend there.
+    """
+    pairs: list[tuple[str, int]] = []
+
+    if platform.system() == "Darwin":
+        for code, class_name in enumerate(_CLASSES):
+            pairs.extend((str(image), code) for image in iter_files(data / class_name))
+    else:
+        with ThreadPoolExecutor() as executor:
+            futures = []
+            for code, class_name in enumerate(_CLASSES):
+                with os.scandir(data / class_name) as entries:
+                    for entry in sorted(entries, key=lambda e: e.name):
+                        if entry.is_file(follow_symlinks=False):
+                            pairs.append((entry.path, code))
+                        elif entry.is_dir(follow_symlinks=False):
+                            futures.append(
+                                (code, executor.submit(list, iter_files(Path(entry.path))))
+                            )
+            for code, future in futures:
+                pairs.extend((str(image), code) for image in future.result())
+
+    count = len(pairs)
+    return Samples(
+        paths=np.fromiter((path for path, _ in pairs), dtype=object, count=count),
+        labels=np.fromiter((code for _, code in pairs), dtype=np.int8, count=count),
+        classes=_CLASSES,
+    )
 
 
 def _compute_splits(
-    all_images: list[tuple[Path, str]], split_ratio: list[float]
-) -> dict[str, list[tuple[Path, str]]]:
-    total = len(all_images)
-
-    if len(split_ratio) == 2:
-        train_end = int(total * split_ratio[0])
-        return {
-            "train": all_images[:train_end],
-            "val": all_images[train_end:],
-        }
-
-    # len == 3
-    train_end = int(total * split_ratio[0])
-    val_end = train_end + int(total * split_ratio[1])
-
-    return {
-        "train": all_images[:train_end],
-        "val": all_images[train_end:val_end],
-        "test": all_images[val_end:],
-    }
-
-
-def _write_splits(split_root: Path, splits: dict[str, list[tuple[Path, str]]]) -> None:
+    all_images: list[tuple[str, str]], split_ratio: list[float]
+) -> dict[str, list[tuple[str, str]]]:
     """
     Compute train/val/(test) split boundaries.
 
+    Boundaries come from one pass of ``itertools.accumulate`` over the
+    ratios, converted to integer offsets, rather than accumulating
+    per-split offsets by hand.
+
     Parameters
     ----------
     all_images : list of tuple
-        List of ``(Path, class_name)`` pairs.
+        List of ``(image_path, class_name)`` pairs.
     split_ratio : list of float
         Ratios that determine split sizes.
 
@@ -188,12 +258,105 @@ def _write_splits(split_root: Path, splits: dict[str, list[tuple[Path, str]]]) -
         Keys are ``"train"``, ``"val"``, and optionally ``"test"``.
         Values are lists of images belonging to each split.
     """
-    for split_name, items in tqdm(splits.items(), desc="Creating splits"):
-        # Create class folders
-        for class_name in ["healthy", "unhealthy"]:
-            (split_root / split_name / class_name).mkdir(parents=True, exist_ok=True)
+    names = ("train", "val") if len(split_ratio) == 2 else ("train", "val", "test")
+    bounds = _split_bounds(len(all_images), split_ratio)
+
+    return {name: all_images[bounds[i] : bounds[i + 1]] for i, name in enumerate(names)}
 
-        # Write files
-        for src, class_name in items:
-            dst = split_root / split_name / class_name / src.name
-            dst.hardlink_to(src)
+
+def _compute_split_indices(total: int, split_ratio: list[float]) -> dict[str, np.ndarray]:
+    """
+    Integer index arrays per split, for consumers indexing parallel arrays.
+
+    One ``np.split`` over ``np.arange(total)`` partitions in C, so callers
+    holding the manifest as structure-of-arrays can select a split with a
+    single fancy-index instead of rebuilding per-element tuples.
+
+    Parameters
+    ----------
+    total : int
+        Number of items being split.
+    split_ratio : list of float
+        Ratios that determine split sizes.
+
+    Returns
+    -------
+    dict of str -> np.ndarray
+        Keys are ``"train"``, ``"val"``, and optionally ``"test"``; values
+        are disjoint int64 index arrays covering ``range(total)``.
+    """
+    names = ("train", "val") if len(split_ratio) == 2 else ("train", "val", "test")
+    bounds = _split_bounds(total, split_ratio)
+    parts = np.split(np.arange(total, dtype=np.int64), bounds[1:-1])
+    return dict(zip(names, parts))
+
+
+def _split_bounds(total: int, split_ratio: list[float]) -> list[int]:
+    """
+    Integer index boundaries for slicing ``total`` items by ``split_ratio``.
+
+    Parameters
+    ----------
+    total : int
+        Number of items being split.
+    split_ratio : list of float
+        Ratios that determine split sizes.
+
+    Returns
+    -------
+    list of int
+        ``len(split_ratio) + 1`` monotonically increasing offsets starting
+        at 0 and ending at ``total``.
+    """
+    cumulative = list(accumulate(split_ratio))
+    return [0, *(int(total * c) for c in cumulative[:-1]), total]
+
+
+def _write_splits(split_root: Path, splits: dict[str, list[tuple[str, str]]]) -> None:
+    """
+    Hardlink each split's files into its train/val/(test) class folders.
+
+    Links are dispatched on a thread pool: linkat is a blocking syscall that
+    releases the GIL, so overlapping them hides per-syscall latency instead
+    of paying one round trip per image.
+
+    Parameters
+    ----------
+    split_root : Path
+        Output directory for the generated split.
+    splits : dict of str -> list
+        Keys are ``"train"``, ``"val"``, and optionally ``"test"``.
+        Values are lists of ``(image_path, class_name)`` pairs for each split.
+    """
+    # Create only the split/class folders the plan actually populates, once
+    # each and before any worker starts, so linking never pays a mkdir or
+    # existence stat per file and never contends.
+    target_dirs = {
+        (split_name, class_name) for split_name, items in splits.items() for _, class_name in items
+    }
+    for split_name, class_name in target_dirs:
+        (split_root / split_name / class_name).mkdir(parents=True, exist_ok=True)
+
+    # Flatten every split into one job list so a single pool stays
+    # saturated across split boundaries instead of draining per split.
+    jobs: list[tuple[str, str]] = []
+    for split_name, items in splits.items():
+        split_dir = os.fspath(split_root / split_name)
+        jobs.extend(
+            (src, os.path.join(split_dir, class_name, os.path.basename(src)))
+            for src, class_name in items
+        )
+
+    if not jobs:
+        return
+
+    def link_file(job: tuple[str, str]) -> None:
+        os.link(*job)
+
+    # Links are syscall-bound with negligible CPU, so oversubscribe
+    # relative to the core count to keep the VFS saturated.
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(jobs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(link_file, job) for job in jobs]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Linking splits"):
+            future.result()
@@ -0,0 +1,40 @@
+import os
+import platform
+import tempfile
+
+import pytest
+
+# Point pytest's tmp_path machinery at the tmpfs-backed /dev/shm on Linux so
+# the file-heavy splitter/deduplicator tests exercise syscalls against RAM
+# instead of the real disk. Setting tempfile.tempdir directly overrides
+# whatever tempfile.gettempdir() would otherwise resolve. Under pytest-xdist
+# (pytest -n auto) this composes as-is: each worker appends its own
+# PYTEST_XDIST_WORKER id to the basetemp it derives from this root, so
+# parallel workers get isolated tmpfs subtrees without extra configuration.
+if (
+    platform.system() == "Linux"
+    and os.path.isdir("/dev/shm")
+    and "TMPDIR" not in os.environ
+    and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+):
+    tempfile.tempdir = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def dummy_dataset(tmp_path_factory):
+    """
+    Session-scoped ``healthy/``/``unhealthy/`` tree with five images per class.
+
+    Built once per session and shared read-only, so tests that only
+    enumerate the tree skip the per-test mkdir/write setup. Tests that
+    mutate files must copy it first (``shutil.copytree`` with
+    ``copy_function=os.link`` keeps that cheap) instead of using it in
+    place.
+    """
+    root = tmp_path_factory.mktemp("dummy_dataset")
+    for class_name in ("healthy", "unhealthy"):
+        class_dir = root / class_name
+        class_dir.mkdir()
+        for i in range(5):
+            (class_dir / f"{class_name}_image_{i}.jpg").touch()
+    return root
@@ -5,7 +5,12 @@ import pytest
 import torch
 from torchvision import transforms
 
-from lib.data import CombinedMegaPlantDataset, MegaPlantDataset, UnhealthyMegaPlantDataset
+from lib.data import (
+    CombinedMegaPlantDataset,
+    MaterializedDataset,
+    MegaPlantDataset,
+    UnhealthyMegaPlantDataset,
+)
 
 
 @pytest.fixture
@@ -78,11 +83,11 @@ def test_dataset_getitem(dataset: MegaPlantDataset):
 
 
 def test_dataset_transforms(tmp_path):
-    # Define a simple transform
+    # Define a simple transform; images arrive as uint8 tensors
     simple_transform = transforms.Compose(
         [
             transforms.Resize((64, 64)),
-            transforms.ToTensor(),
+            transforms.ConvertImageDtype(torch.float32),
         ]
     )
 
@@ -150,3 +155,23 @@ def test_combined_dataset_getitem(combined_dataset: CombinedMegaPlantDataset):
         image_path, label = combined_dataset[i]
         assert type(image_path) in {Path, PosixPath}
         assert label in combined_dataset.CLASS_MAP.values()  # Check all class labels
+
+
+def test_materialized_dataset(dataset: MegaPlantDataset, tmp_path):
+    out_dir = dataset.materialize(tmp_path / "materialized", shape=(3, 32, 32))
+
+    materialized = MaterializedDataset(out_dir)
+
+    assert len(materialized) == len(dataset)
+    for i in range(len(materialized)):
+        image, label = materialized[i]
+        assert isinstance(image, torch.Tensor)
+        assert image.shape == (3, 32, 32)
+        assert image.dtype == torch.float32
+        assert label in {0, 1}
+
+
+def test_resolve_class(dataset: MegaPlantDataset):
+    assert dataset.resolve_class("Tomato_early_blight") == dataset.STATUS_MAP["unhealthy"]
+    assert dataset.resolve_class("corn_rust_leaf") == dataset.STATUS_MAP["unhealthy"]
+    assert dataset.resolve_class("Apple_leaf") == dataset.STATUS_MAP["healthy"]
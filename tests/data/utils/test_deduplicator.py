@@ -10,9 +10,9 @@ def test_hash_file(tmp_path):
     # Compute the hash using the Deduplicator
     computed_hash = Deduplicator.hash_file(temp_file)
 
-    # Precomputed MD5 hash for the given content
-    # This expected hash was precomputed using md5sum command line tool
-    expected_hash = "281806b4919a3accdd2ddbebbe7372e9"
+    # Precomputed BLAKE3 hash for the given content
+    # This expected hash was precomputed using the b3sum command line tool
+    expected_hash = "96389fefe4b39a3eaeaa8a56900cc84a7c0136a6f2fd68b5c691f4f376289003"
 
     assert computed_hash == expected_hash
 
@@ -22,8 +22,9 @@ def test_get_files(tmp_path):
     (tmp_path / "subdir").mkdir()
     file1 = tmp_path / "file1.txt"
     file2 = tmp_path / "subdir" / "file2.txt"
-    file1.write_text("File 1 content")
-    file2.write_text("File 2 content")
+    # touch() skips the codec and data-block write; the walk only stats.
+    file1.touch()
+    file2.touch()
 
     # Get all files
     all_files = get_files(tmp_path)
@@ -72,4 +73,4 @@ def test_deduplicate_folder_keep_last(tmp_path):
 
     assert "file1.txt" not in remaining_file_names
     assert "file2.txt" in remaining_file_names
-    assert len(remaining_files) == 1  # One duplicate removed
\ No newline at end of file
+    assert len(remaining_files) == 1  # One duplicate removed